@@ -1,13 +1,21 @@
 import logging
-import re
-from typing import Optional, Tuple, Dict, Any
-from difflib import SequenceMatcher
-
-import jellyfish
+import math
+import sys
+import threading
+from collections import defaultdict
+from typing import ClassVar, Optional, Tuple, Dict, Any, List
+
+import numpy as np
+import orjson
+from django.contrib.postgres.search import TrigramSimilarity
 from django.db import transaction
 from django.db.models import Q
+from django.db.models.functions import Length
+from rapidfuzz import process
+from rapidfuzz.distance import JaroWinkler
 
 from .models import Movie, Source
+from .normalization import COMMON_WORDS, normalize_title
 from .redis_client import RedisClient
 
 logger = logging.getLogger(__name__)
@@ -21,45 +29,54 @@ class ContentManager:
 	3. Always create/update source mapping for the matched/existing item
 	"""
 
-	def __init__(self):
+	def __init__(self, preload_catalog: bool = False):
 		self.matcher = EnhancedContentMatcher()
+		if preload_catalog:
+			# Long-running ingest (the scraper pipeline): match against memory instead of Postgres.
+			# The catalog is loaded once per process and shared by every pipeline's matcher.
+			self.matcher.load_catalog()
 
 	def process_scraped_content(
 			self, title: str,
 			title_en: str,
 			release_year: int, movie_type: str, platform: str,
-			source_id: str, url: str = "", raw_payload: dict = None, **additional_metadata) -> Tuple[Movie, bool, bool]:
+			source_id: str, url: str = "", raw_payload: dict = None, defer_source: bool = False,
+			**additional_metadata) -> Tuple[Movie, bool, Source]:
 		"""
 		Process scraped content with the optimal workflow:
 
-		Returns: (movie, was_content_created, was_source_created)
+		With ``defer_source`` the source mapping is returned unsaved, for the caller
+		to insert in bulk via ``create_sources_bulk``.
+
+		Does not open a transaction of its own: callers wrap it (or a whole batch of
+		calls) in ``transaction.atomic()``.
+
+		Returns: (movie, was_content_created, source), the source unsaved with ``defer_source``
 		"""
-		with transaction.atomic():
-			# Step 1: Find existing content item or create new one if no match
-			movie, content_created = self.matcher.find_or_get_movie(
-				title=title,
-				title_en=title_en,
-				release_year=release_year,
-				movie_type=movie_type,
-				**additional_metadata
-			)
+		# Step 1: Find existing content item or create new one if no match
+		movie, content_created = self.matcher.find_or_get_movie(
+			title=title,
+			title_en=title_en,
+			release_year=release_year,
+			movie_type=movie_type,
+			**additional_metadata
+		)
 
-			# Step 2: Always create/update the source mapping for the content item
-			source = self._create_source(
-				movie=movie,
-				platform=platform,
-				source_id=source_id,
-				url=url,
-				raw_payload=raw_payload
-			)
+		# Step 2: Always create/update the source mapping for the content item
+		source_fields = {
+			"movie": movie, "platform": platform, "source_id": source_id, "url": url, "raw_payload": raw_payload
+		}
+		if defer_source:
+			return movie, content_created, Source(**source_fields)
+		source = self._create_source(**source_fields)
 
+		if logger.isEnabledFor(logging.INFO):
 			logger.info(
-				f"Processed: {title} → {movie.title} "
-				f"(Content: {'Created' if content_created else 'Existing'}, "
-				f"Source: {'Created' if source else 'Existing'})"
+				"Processed: %s → %s (Content: %s, Source: %s)", title, movie.title,
+				"Created" if content_created else "Existing", "Created" if source else "Existing"
 			)
 
-			return movie, content_created, source
+		return movie, content_created, source
 
 	def _create_source(
 			self,
@@ -86,6 +103,86 @@ class ContentManager:
 		)
 		return source
 
+	def process_scraped_batch(self, records: List[Dict[str, Any]]) -> List[Tuple[Movie, bool, Source]]:
+		"""
+		Bulk counterpart of ``process_scraped_content(..., defer_source=True)``.
+
+		Each record holds the keyword arguments of ``process_scraped_content`` (``genres``
+		included). Every unmatched title is inserted with a single ``bulk_create``; records
+		that normalize to the same new title share one Movie. Like the single-item path,
+		this does not open a transaction, and sources are returned unsaved.
+
+		Returns: [(movie, was_content_created, source)] in record order
+		"""
+		# Redis MGET first; only cache misses go to Postgres / the in-memory catalog
+		matches = self.matcher.find_matching_items_bulk(records)
+
+		new_movies: List[Tuple[Movie, list]] = []
+		new_movie_for_key: Dict[tuple, Movie] = {}
+		created_indexes = set()
+		for index, (record, match) in enumerate(zip(records, matches, strict=True)):
+			if match is not None:
+				continue
+			year, movie_type = record["release_year"], record["movie_type"]
+			normalized = normalize_title(record["title_en"] or record["title"])
+			normalized_original = normalize_title(record["title"])
+			# Records that exact matching would pair up share one new movie. An empty normalized
+			# title (e.g. only stopwords) identifies nothing, so it is never used as a key; without
+			# either, the raw (title, title_en, year) identity is, as in exact matching.
+			keys = [
+				(column, value, year, movie_type)
+				for column, value in (("title", normalized), ("original", normalized_original)) if value
+			] or [("raw", record["title"], record["title_en"], year)]
+			movie = next((new_movie_for_key[key] for key in keys if key in new_movie_for_key), None)
+			if movie is None:
+				movie = Movie(
+					title=record["title"],
+					title_en=record["title_en"],
+					year=year,
+					type=movie_type,
+					normalized_title=normalized,
+					normalized_original_title=normalized_original,
+				)
+				new_movies.append((movie, record.get("genres", [])))
+				created_indexes.add(index)
+			for key in keys:
+				new_movie_for_key.setdefault(key, movie)
+			matches[index] = movie
+
+		self.matcher.create_movies_bulk(new_movies)
+
+		return [
+			(
+				movie,
+				index in created_indexes,
+				Source(
+					movie=movie, platform=record["platform"], source_id=record["source_id"],
+					url=record.get("url", ""), raw_payload=record.get("raw_payload")
+				),
+			)
+			for index, (record, movie) in enumerate(zip(records, matches, strict=True))
+		]
+
+	def create_sources_bulk(self, sources: List[Source], batch_size: int = 500) -> int:
+		"""
+		Insert many source mappings in one multi-row INSERT per batch.
+
+		Rows whose (platform, source_id) already exists are skipped by the unique index.
+		Returns the number of sources that were actually new.
+		"""
+		if not sources:
+			return 0
+		existing = set()
+		for platform in {source.platform for source in sources}:
+			existing.update(
+				(platform, source_id) for source_id in Source.objects.filter(
+					platform=platform,
+					source_id__in=[source.source_id for source in sources if source.platform == platform]
+				).values_list("source_id", flat=True)
+			)
+		Source.objects.bulk_create(sources, ignore_conflicts=True, batch_size=batch_size)
+		return len({(source.platform, source.source_id) for source in sources} - existing)
+
 	def _update_content_metadata(self, movie: Movie, new_metadata: Dict[str, Any]):
 		"""
 		Update content item with new metadata if it improves the record
@@ -106,15 +203,86 @@ class EnhancedContentMatcher:
 	Optimized matcher that focuses on finding existing content rather than creating duplicates
 	"""
 
+	# In-memory catalog indexes, only populated by load_catalog(). They live on the class so every
+	# matcher in the process (one per spider pipeline) sees the movies the others create.
+	_exact_index: ClassVar[Optional[Dict[Tuple[str, int, str], int]]] = None
+	_original_index: ClassVar[Optional[Dict[Tuple[str, int, str], int]]] = None
+	_candidates_by_year: ClassVar[Optional[Dict[Tuple[int, str], Tuple[List[int], List[str]]]]] = None
+	_catalog_lock: ClassVar[threading.Lock] = threading.Lock()
+
 	def __init__(self):
 		self.redis = RedisClient()
-		self.common_words = {"the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for", "of", "with", "by"}
+		self.common_words = COMMON_WORDS
 
 		self.title_variations = {
 			"متری شیش و نیم": ["metri shish o nim", "metri shesh o nim", "metri 6.5"],
 			"شقایق": ["shaghayegh"],
 			"خانه پدری": ["khane pedari", "khaneh pedari", "father's house"],
 		}
+		# Reverse index keyed by the normalized variation, so lookups compare like with like
+		self._variation_to_base = {
+			self.normalize_title(variation): base_title
+			for base_title, variations in self.title_variations.items()
+			for variation in variations
+		}
+
+	@classmethod
+	def load_catalog(cls):
+		"""
+		Load every movie's matching keys once per process so exact and fuzzy matching skip Postgres:
+		{(normalized_title, year, type): id}, {(normalized_original_title, year, type): id}
+		and {(year, type): ([ids], [normalized_titles])}
+		"""
+		with cls._catalog_lock:
+			if cls._exact_index is not None:
+				return
+			cls._exact_index = {}
+			cls._original_index = {}
+			cls._candidates_by_year = {}
+			for movie_id, normalized, normalized_original, year, movie_type in Movie.objects.values_list(
+					"id", "normalized_title", "normalized_original_title", "year", "type").iterator(chunk_size=2000):
+				cls._add_to_catalog(movie_id, normalized, normalized_original, year, movie_type)
+		logger.info(f"Loaded {len(cls._exact_index)} catalog titles into matcher")
+
+	def _index_movie(self, movie_id: int, normalized: str, normalized_original: str, year: int, movie_type: str):
+		if self._exact_index is None:
+			return
+		# Pipelines of concurrent spiders index from worker threads; keep id/title lists aligned
+		with self._catalog_lock:
+			self._add_to_catalog(movie_id, normalized, normalized_original, year, movie_type)
+
+	@classmethod
+	def _add_to_catalog(cls, movie_id: int, normalized: str, normalized_original: str, year: int, movie_type: str):
+		if normalized_original:
+			cls._original_index.setdefault((normalized_original, year, movie_type), movie_id)
+		if not normalized or (normalized, year, movie_type) in cls._exact_index:
+			return
+		cls._exact_index[(normalized, year, movie_type)] = movie_id
+		ids, titles = cls._candidates_by_year.setdefault((year, movie_type), ([], []))
+		ids.append(movie_id)
+		titles.append(normalized)
+
+	@classmethod
+	def _forget_movie(cls, movie_id: int, title_keys: list, original_keys: list):
+		"""Drop exact-index entries that still point at ``movie_id``, so the keys can be indexed again"""
+		with cls._catalog_lock:
+			for index, keys in ((cls._exact_index, title_keys), (cls._original_index, original_keys)):
+				for key in keys:
+					if index.get(key) == movie_id:
+						del index[key]
+
+	@staticmethod
+	def _year_band(
+			catalog: dict, release_year: int, movie_type: str, year_tolerance: int
+	) -> Tuple[List[int], List[str]]:
+		"""Concatenate the parallel id/title lists of every year in the band, without per-row Python work"""
+		ids, titles = [], []
+		for year in range(release_year - year_tolerance, release_year + year_tolerance + 1):
+			bucket = catalog.get((year, movie_type))
+			if bucket:
+				ids.extend(bucket[0])
+				titles.extend(bucket[1])
+		return ids, titles
 
 	def find_or_get_movie(
 			self,
@@ -129,7 +297,28 @@ class EnhancedContentMatcher:
 
 		Returns: (content_item, created)
 		"""
-		# Try multiple matching strategies in order of reliability
+		match = self.find_matching_movie(title, title_en, release_year, movie_type, additional_metadata)
+		if match:
+			return match, False  # Existing item, not created
+
+		# No match found - create new content item
+		return self._create_movie(title, title_en, release_year, movie_type, additional_metadata), True
+
+	def find_matching_movie(
+			self,
+			title: str,
+			title_en: str,
+			release_year: int,
+			movie_type: str,
+			additional_metadata: Optional[dict] = None
+	) -> Optional[Movie]:
+		"""Run the matching strategies in order of reliability, without creating anything"""
+		if not release_year:
+			# Every strategy needs a year; skip building and calling them
+			logger.debug("Skipping match for %r: no release year", title)
+			return None
+
+		additional_metadata = additional_metadata or {}
 		matching_strategies = [
 			lambda: self._match_by_exact_criteria(title=title, title_en=title_en, release_year=release_year,
 												  movie_type=movie_type, additional_metadata=additional_metadata),
@@ -141,13 +330,118 @@ class EnhancedContentMatcher:
 
 		for strategy in matching_strategies:
 			match = strategy()  # Call the lambda function
-			# match = strategy(release_year=release_year, movie_type=movie_type, additional_metadata=additional_metadata)
 			if match:
-				logger.info(f"Match found via {strategy.__name__}: {match.title}")
-				return match, False  # Existing item, not created
+				logger.info("Match found via %s: %s", strategy.__name__, match.title)
+				return match
+		return None
 
-		# No match found - create new content item
-		return self._create_movie(title, title_en, release_year, movie_type, additional_metadata), True
+	def find_matching_items_bulk(self, items: List[Dict[str, Any]]) -> List[Optional[Movie]]:
+		"""
+		Match a batch of scraped items, reading and writing the Redis match cache in bulk
+
+		Each item is a dict with ``title``, ``title_en``, ``release_year`` and ``movie_type``
+		(the ``process_scraped_content`` argument names).
+		Returns the matched movie (or None) for every item, in order.
+		"""
+		lookups = [
+			(item["title"], item.get("title_en", ""), item["release_year"], item.get("movie_type", "movie"))
+			for item in items
+		]
+		cached = [self._decode_cached_match(payload) for payload in self.redis.get_cached_matches(lookups)]
+
+		results: List[Optional[Movie]] = list(cached)
+		uncached = [index for index, hit in enumerate(cached) if hit is None]
+		exact_matches = self._match_by_exact_criteria_bulk([items[index] for index in uncached])
+		misses = []
+		for index, movie in zip(uncached, exact_matches, strict=True):
+			results[index] = movie
+			if movie is None:
+				misses.append(index)
+
+		# Fuzzy-match every remaining item in one vectorized pass, then fall back to known variations
+		fuzzy_matches = self.match_batch([items[index] for index in misses])
+		for index, movie in zip(misses, fuzzy_matches, strict=True):
+			item = items[index]
+			results[index] = movie or self._match_by_title_variations(
+				title=item["title"], title_en=item.get("title_en", ""), release_year=item["release_year"],
+				movie_type=item.get("movie_type", "movie"), additional_metadata={}
+			)
+
+		to_cache = [
+			(lookup, movie)
+			for lookup, movie, hit in zip(lookups, results, cached, strict=True)
+			if movie is not None and hit is None
+		]
+		self.redis.cache_matches(to_cache)
+		return results
+
+	@staticmethod
+	def _decode_cached_match(payload) -> Optional[Movie]:
+		"""
+		Turn a match-cache value into a Movie with only id/title/year loaded (the other fields
+		are deferred, so they are fetched on access rather than defaulted), or None for a miss
+		or an unreadable value
+		"""
+		if not payload:
+			return None
+		try:
+			value = orjson.loads(payload)
+		except orjson.JSONDecodeError:
+			return None
+		if not isinstance(value, dict) or value.get("id") is None:
+			return None
+		return Movie.from_db(None, ["id", "title", "year"], (value["id"], value.get("title"), value.get("year")))
+
+	def match_batch(self, items: List[Dict[str, Any]], threshold: float = 0.9) -> List[Optional[Movie]]:
+		"""
+		Fuzzy-match many items at once with the same Jaro-Winkler rule as
+		``_match_by_fuzzy_logic``.
+
+		Items are grouped by (year, type); each group is scored against its year band with
+		``rapidfuzz.process.cdist`` on all cores, and ``argmax`` picks the best candidate per row.
+		"""
+		groups: Dict[Tuple[int, str], List[Tuple[int, str]]] = defaultdict(list)
+		for index, item in enumerate(items):
+			release_year = item.get("release_year")
+			normalized_query = self.normalize_title(item.get("title_en") or item.get("title"))
+			if release_year and normalized_query:
+				groups[(release_year, item.get("movie_type", "movie"))].append((index, normalized_query))
+		if not groups:
+			return [None] * len(items)
+
+		year_tolerance = 1
+		catalog = self._candidates_by_year
+		if catalog is None:
+			catalog = defaultdict(lambda: ([], []))
+			for movie_id, normalized, year, movie_type in Movie.objects.filter(
+					year__gte=min(year for year, _ in groups) - year_tolerance,
+					year__lte=max(year for year, _ in groups) + year_tolerance,
+					type__in={movie_type for _, movie_type in groups},
+			).values_list("id", "normalized_title", "year", "type"):
+				if normalized:
+					catalog[(year, movie_type)][0].append(movie_id)
+					catalog[(year, movie_type)][1].append(normalized)
+
+		matched_ids: Dict[int, int] = {}
+		for (release_year, movie_type), queries in groups.items():
+			with self._catalog_lock:
+				candidate_ids, candidate_titles = self._year_band(catalog, release_year, movie_type, year_tolerance)
+			if not candidate_ids:
+				continue
+
+			query_titles = [normalized_query for _, normalized_query in queries]
+			# Scores under the cutoff come back as 0, so any non-zero cell is a valid match
+			scores = process.cdist(
+				query_titles, candidate_titles, scorer=JaroWinkler.normalized_similarity, processor=None,
+				score_cutoff=threshold, dtype=np.float32, workers=-1
+			)
+			best_columns = scores.argmax(axis=1)
+			for (index, _), row, column in zip(queries, scores, best_columns, strict=True):
+				if row[column] > 0:
+					matched_ids[index] = candidate_ids[column]
+
+		movies = Movie.objects.in_bulk(set(matched_ids.values()))
+		return [movies.get(matched_ids[index]) if index in matched_ids else None for index in range(len(items))]
 
 	def _match_by_exact_criteria(self, title: str, title_en: str, release_year: int, movie_type: str,
 								 additional_metadata: dict) -> \
@@ -156,24 +450,122 @@ class EnhancedContentMatcher:
 		if not release_year:
 			return None
 
-		normalized_title = self.normalize_title(
-			title_en) if title_en != '' or title_en is not None else self.normalize_title(title)
-
-		# Build query for exact matching
-		query = Q(year=release_year, type=movie_type)
-
-		# Try multiple title fields
-		title_filters = Q()
-		for field in ['title', 'title_en']:
-			title_filters |= Q(**{f"{field}__iexact": normalized_title})
-
-		query &= title_filters
+		# Prefer the English title; fall back to the original when it is missing or empty.
+		# The original title is compared on its own too, so an item that only carries the
+		# Persian title still finds a movie stored with both.
+		normalized_title = self.normalize_title(title_en or title)
+		normalized_original = self.normalize_title(title)
+		title_filter = self._exact_title_filter(normalized_title, normalized_original)
+		if not title_filter:
+			# Nothing left after normalizing (e.g. only stopwords): fall back to the raw
+			# (title, title_en, year) identity, which is also the table's unique constraint
+			return Movie.objects.filter(title=title, title_en=title_en or "", year=release_year).first()
+
+		if self._exact_index is not None:
+			title_key = (normalized_title, release_year, movie_type)
+			original_key = (normalized_original, release_year, movie_type)
+			movie_id = self._exact_index.get(title_key) or self._original_index.get(original_key)
+			if movie_id:
+				movie = Movie.objects.filter(id=movie_id).first()
+				if movie:
+					return movie
+				# The row is gone (deleted since it was indexed): drop it and ask Postgres again
+				self._forget_movie(movie_id, [title_key], [original_key])
 
 		try:
-			return Movie.objects.filter(query).first()
+			# Served by the (year, normalized_title) and (year, normalized_original_title) indexes.
+			# With a preloaded catalog this still runs on a miss: rows written after the snapshot
+			# (by the API or another scraper process) are only visible here.
+			movie = Movie.objects.filter(title_filter, year=release_year, type=movie_type).first()
 		except Exception as e:
 			logger.error(f"Error in exact matching: {e}")
 			return None
+		if movie:
+			self._index_movie(movie.id, movie.normalized_title, movie.normalized_original_title, movie.year, movie.type)
+		return movie
+
+	@staticmethod
+	def _exact_title_filter(normalized_title: str, normalized_original: str) -> Q:
+		"""Equality on whichever normalized titles are non-empty; an empty Q means nothing to match on"""
+		title_filter = Q()
+		if normalized_title:
+			title_filter |= Q(normalized_title=normalized_title)
+		if normalized_original:
+			title_filter |= Q(normalized_original_title=normalized_original)
+		return title_filter
+
+	def _match_by_exact_criteria_bulk(self, items: List[Dict[str, Any]]) -> List[Optional[Movie]]:
+		"""
+		``_match_by_exact_criteria`` for many items: keys missing from the preloaded catalog
+		(or every key, without one) are resolved with one indexed query, and all matched
+		movies are loaded with one ``in_bulk``
+		"""
+		# Per item: (normalized_title key, normalized_original_title key), either None when empty
+		keys = []
+		for item in items:
+			release_year = item.get("release_year")
+			movie_type = item.get("movie_type", "movie")
+			normalized_title = self.normalize_title(item.get("title_en") or item["title"])
+			normalized_original = self.normalize_title(item["title"])
+			keys.append((
+				(normalized_title, release_year, movie_type) if normalized_title and release_year else None,
+				(normalized_original, release_year, movie_type) if normalized_original and release_year else None,
+			))
+
+		by_title: Dict[Tuple[str, int, str], int] = {}
+		by_original: Dict[Tuple[str, int, str], int] = {}
+		movies: Dict[int, Movie] = {}
+		if self._exact_index is not None:
+			by_title = {key: self._exact_index[key] for key, _ in keys if key in self._exact_index}
+			by_original = {key: self._original_index[key] for _, key in keys if key in self._original_index}
+			movies = Movie.objects.in_bulk({*by_title.values(), *by_original.values()})
+			# Rows deleted since they were indexed: drop them and resolve their keys from Postgres
+			for movie_id in {*by_title.values(), *by_original.values()} - movies.keys():
+				stale_title_keys = [key for key, value in by_title.items() if value == movie_id]
+				stale_original_keys = [key for key, value in by_original.items() if value == movie_id]
+				for key in stale_title_keys:
+					del by_title[key]
+				for key in stale_original_keys:
+					del by_original[key]
+				self._forget_movie(movie_id, stale_title_keys, stale_original_keys)
+		unresolved = [
+			(title_key, original_key) for title_key, original_key in keys
+			if (title_key or original_key) and title_key not in by_title and original_key not in by_original
+		]
+		if unresolved:
+			title_keys = {key for key, _ in unresolved if key}
+			original_keys = {key for _, key in unresolved if key}
+			all_keys = title_keys | original_keys
+			for movie_id, normalized, normalized_original, year, movie_type in Movie.objects.filter(
+					Q(normalized_title__in={key[0] for key in title_keys})
+					| Q(normalized_original_title__in={key[0] for key in original_keys}),
+					year__in={key[1] for key in all_keys},
+					type__in={key[2] for key in all_keys},
+			).order_by("id").values_list("id", "normalized_title", "normalized_original_title", "year", "type"):
+				by_title.setdefault((normalized, year, movie_type), movie_id)
+				by_original.setdefault((normalized_original, year, movie_type), movie_id)
+				self._index_movie(movie_id, normalized, normalized_original, year, movie_type)
+
+		matched_ids = [by_title.get(title_key) or by_original.get(original_key) for title_key, original_key in keys]
+
+		# Items with no normalized title left: the raw (title, title_en, year) identity, as above
+		raw_keys = {
+			index: (item["title"], item.get("title_en") or "", item["release_year"])
+			for index, (item, (title_key, original_key)) in enumerate(zip(items, keys, strict=True))
+			if not title_key and not original_key and item.get("release_year")
+		}
+		if raw_keys:
+			by_raw = {}
+			for movie_id, *raw_key in Movie.objects.filter(
+					title__in={key[0] for key in raw_keys.values()},
+					year__in={key[2] for key in raw_keys.values()},
+			).order_by("id").values_list("id", "title", "title_en", "year"):
+				by_raw.setdefault(tuple(raw_key), movie_id)
+			for index, raw_key in raw_keys.items():
+				matched_ids[index] = by_raw.get(raw_key)
+
+		movies.update(Movie.objects.in_bulk({movie_id for movie_id in matched_ids if movie_id} - movies.keys()))
+		return [movies.get(movie_id) if movie_id else None for movie_id in matched_ids]
 
 	def _match_by_fuzzy_logic(self, title: str, title_en: str, release_year: int, movie_type: str,
 							  additional_metadata: dict) -> \
@@ -186,25 +578,43 @@ class EnhancedContentMatcher:
 		min_year = release_year - year_tolerance
 		max_year = release_year + year_tolerance
 
+		normalized_query = self.normalize_title(title_en or title)
+		if not normalized_query:
+			return None
+
+		if self._candidates_by_year is not None:
+			with self._catalog_lock:
+				candidate_ids, candidate_titles = self._year_band(
+					self._candidates_by_year, release_year, movie_type, year_tolerance
+				)
+			best_index, _ = self._best_candidate(normalized_query, candidate_titles, threshold=0.9)
+			return Movie.objects.filter(id=candidate_ids[best_index]).first() if best_index is not None else None
+
+		min_length, max_length = self._length_bounds(len(normalized_query), threshold=0.9)
+
 		try:
+			# The trigram GIN index narrows the year band to plausible titles server-side, and titles
+			# whose length alone rules out the threshold are dropped before they reach Python;
+			# the final decision is still made by the rapidfuzz scorer below.
 			potential_matches = Movie.objects.filter(
 				year__gte=min_year,
 				year__lte=max_year,
-				type=movie_type
-			)[:100]  # Performance limit
-
-			best_match = None
-			best_score = 0.0
-
-			for item in potential_matches:
-				score = self.similarity_score(title_en,
-											  item.title_en) if title_en != '' or title_en is not None else self.similarity_score(
-					title, item.title_en)
-				if score > best_score and score >= 0.9:  # Higher threshold for fuzzy matching
-					best_score = score
-					best_match = item
-
-			return best_match
+				type=movie_type,
+				normalized_title__trigram_similar=normalized_query,
+			).annotate(
+				similarity=TrigramSimilarity("normalized_title", normalized_query),
+				title_length=Length("normalized_title"),
+			).filter(
+				title_length__gte=min_length,
+				title_length__lte=max_length,
+			).order_by("-similarity").values_list("id", "normalized_title")[:100]  # Performance limit
+
+			choices = {movie_id: normalized_item for movie_id, normalized_item in potential_matches if normalized_item}
+
+			best_id, _ = self._best_candidate(normalized_query, choices, threshold=0.9)
+			if best_id is None:
+				return None
+			return Movie.objects.filter(id=best_id).first()
 
 		except Exception as e:
 			logger.error(f"Error in fuzzy matching: {e}")
@@ -217,21 +627,18 @@ class EnhancedContentMatcher:
 		if not release_year:
 			return None
 
-		normalized_title = self.normalize_title(
-			title_en) if title_en != '' or title_en is not None else self.normalize_title(title)
-
-		# Check if this title matches any known variations
-		for base_title, variations in self.title_variations.items():
-			if normalized_title in variations:
-				try:
-					return Movie.objects.get(
-						title__icontains=base_title,
-						year=release_year,
-						type=movie_type
-					)
-				except (Movie.DoesNotExist, Movie.MultipleObjectsReturned):
-					continue
-		return None
+		normalized_title = self.normalize_title(title_en or title)
+
+		base_title = self._variation_to_base.get(normalized_title)
+		if not base_title:
+			return None
+
+		# Base titles are canonical full titles, so indexed equality replaces the ILIKE '%...%' scan
+		return Movie.objects.filter(
+			Q(title=base_title) | Q(normalized_title=self.normalize_title(base_title)),
+			year=release_year,
+			type=movie_type
+		).first()
 
 	def _create_movie(self, title: str, title_en: str, release_year: int, movie_type: str,
 					  metadata: dict) -> Movie:
@@ -248,22 +655,77 @@ class EnhancedContentMatcher:
 		if 'genres' in metadata:
 			movie.genres.set(metadata['genres'])
 
-		logger.info(f"Created new content item: {movie.title_en}")
+		# Index only once committed, so a rolled-back fallback item leaves no id behind in the catalog
+		transaction.on_commit(lambda: self._index_movie(
+			movie.id, movie.normalized_title, movie.normalized_original_title, movie.year, movie.type
+		))
+		logger.info("Created new content item: %s", movie.title_en)
 		return movie
 
+	def create_movies_bulk(self, movies_with_genres: List[Tuple[Movie, list]], batch_size: int = 500):
+		"""
+		Insert unsaved movies (normalized titles already set) in one multi-row INSERT,
+		then link their genres with one INSERT into the through table
+		"""
+		if not movies_with_genres:
+			return
+		movies = Movie.objects.bulk_create([movie for movie, _ in movies_with_genres], batch_size=batch_size)
+
+		Movie.genres.through.objects.bulk_create(
+			[
+				Movie.genres.through(movie_id=movie.id, genre_id=genre.id)
+				for movie, (_, genres) in zip(movies, movies_with_genres, strict=True)
+				for genre in genres
+			],
+			ignore_conflicts=True,
+			batch_size=batch_size,
+		)
+
+		# Index only once committed, so a rolled-back batch leaves no ids behind in the catalog
+		transaction.on_commit(lambda: [
+			self._index_movie(movie.id, movie.normalized_title, movie.normalized_original_title, movie.year, movie.type)
+			for movie in movies
+		])
+		logger.info(f"Created {len(movies)} new content items")
+
 	# Keep the existing helper methods
 	def normalize_title(self, title: str) -> str:
-		if not title:
-			return ""
-		title = title.lower().strip()
-		title = re.sub(r"[^\w\s]", " ", title)
-		title = " ".join(title.split())
-		words = [word for word in title.split() if word not in self.common_words]
-		return " ".join(words)
+		return normalize_title(title, self.common_words)
+
+	@staticmethod
+	def _length_bounds(length: int, threshold: float) -> Tuple[int, int]:
+		"""
+		Candidate title lengths that can still reach ``threshold`` Jaro-Winkler similarity.
+
+		The Winkler prefix bonus is at most 0.4 * (1 - jaro), so JW >= t needs jaro >= (t - 0.4) / 0.6;
+		jaro between strings of lengths a <= b is at most (2 + a / b) / 3, so a / b must be at least
+		3 * jaro - 2. Anything outside these bounds cannot match, whatever its characters.
+		"""
+		min_ratio = 3 * (threshold - 0.4) / 0.6 - 2
+		if min_ratio <= 0:
+			return 0, sys.maxsize
+		return math.ceil(length * min_ratio), math.floor(length / min_ratio)
+
+	def _best_candidate(self, normalized_query: str, choices, threshold: float) -> Tuple[Optional[Any], float]:
+		"""
+		Pick the key (or list index) of the best scoring normalized title in ``choices``.
+
+		Equivalent to taking the max of ``similarity_score`` over every candidate,
+		but the scorer runs over the whole batch in a single rapidfuzz call.
+		"""
+		if not normalized_query or not choices:
+			return None, 0.0
+
+		best = process.extractOne(
+			normalized_query, choices, scorer=JaroWinkler.normalized_similarity, processor=None, score_cutoff=threshold
+		)
+		if not best:
+			return None, 0.0
+		return best[2], best[1]
 
 	def similarity_score(self, title1: str, title2: str) -> float:
 		normalized1 = self.normalize_title(title1)
-		normalized2 = self.normalize_title(title2)
+		normalized2 = normalized1 if title1 == title2 else self.normalize_title(title2)
 
 		if not normalized1 or not normalized2:
 			return 0.0
@@ -271,8 +733,4 @@ class EnhancedContentMatcher:
 		if normalized1 == normalized2:
 			return 1.0
 
-		ratios = [
-			SequenceMatcher(None, normalized1, normalized2).ratio(),
-			jellyfish.jaro_winkler_similarity(normalized1, normalized2),
-		]
-		return max(ratios)
+		return JaroWinkler.normalized_similarity(normalized1, normalized2)
@@ -0,0 +1,31 @@
+from django.db import migrations, models
+
+from api.catalog.normalization import normalize_title
+
+
+def populate_normalized_title(apps, schema_editor):
+    Movie = apps.get_model('catalog', 'Movie')
+    movies = list(Movie.objects.only('id', 'title', 'title_en'))
+    for movie in movies:
+        movie.normalized_title = normalize_title(movie.title_en or movie.title)
+    Movie.objects.bulk_update(movies, ['normalized_title'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0002_remove_movie_unique_title_year_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='movie',
+            name='normalized_title',
+            field=models.CharField(blank=True, default='', editable=False, max_length=500),
+        ),
+        migrations.RunPython(populate_normalized_title, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='movie',
+            index=models.Index(fields=['year', 'normalized_title'], name='movies_year_norm_title_idx'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+from django.db import migrations, models
+
+from api.catalog.normalization import normalize_title
+
+
+def populate_normalized_original_title(apps, schema_editor):
+    Movie = apps.get_model('catalog', 'Movie')
+    movies = list(Movie.objects.only('id', 'title'))
+    for movie in movies:
+        movie.normalized_original_title = normalize_title(movie.title)
+    Movie.objects.bulk_update(movies, ['normalized_original_title'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0005_movie_fuzzy_cover_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='movie',
+            name='normalized_original_title',
+            field=models.CharField(blank=True, default='', editable=False, max_length=500),
+        ),
+        migrations.RunPython(populate_normalized_original_title, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='movie',
+            index=models.Index(fields=['year', 'normalized_original_title'], name='movies_year_norm_orig_idx'),
+        ),
+    ]
@@ -1,6 +1,9 @@
+from django.contrib.postgres.indexes import GinIndex
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
 
+from .normalization import normalize_title
+
 
 class Platform(models.TextChoices):
     FILIMO = "filimo", "Filimo"
@@ -28,6 +31,9 @@ class Movie(models.Model):
     title = models.CharField(max_length=500, db_index=True)
     year = models.IntegerField(validators=[MinValueValidator(1900), MaxValueValidator(2030)], db_index=True)
     type = models.CharField(max_length=10, choices=ContentType.choices, default=ContentType.MOVIE, db_index=True)
+    # Matching keys derived from title_en (or title) and from the original title; kept in sync by save()
+    normalized_title = models.CharField(max_length=500, blank=True, default="", editable=False)
+    normalized_original_title = models.CharField(max_length=500, blank=True, default="", editable=False)
 
     genres = models.ManyToManyField(Genre, related_name="movies", db_table="movie_genres")
     created_at = models.DateTimeField(null=False, auto_now_add=True)
@@ -36,13 +42,25 @@ class Movie(models.Model):
     class Meta:
         db_table = "movies"
         indexes = [
-            models.Index(fields=["year", "type"]),
+            # Covering index: year-band candidate loads are served by an index-only scan
+            models.Index(fields=["year", "type"], include=["id", "normalized_title"], name="movies_fuzzy_cover"),
             models.Index(fields=["title", "title_en"]),
+            models.Index(fields=["year", "normalized_title"], name="movies_year_norm_title_idx"),
+            models.Index(fields=["year", "normalized_original_title"], name="movies_year_norm_orig_idx"),
+            GinIndex(fields=["normalized_title"], name="movies_norm_title_trgm", opclasses=["gin_trgm_ops"]),
         ]
 
     def __str__(self):
         return f"{self.title} ({self.year})"
 
+    def save(self, *args, **kwargs):
+        self.normalized_title = normalize_title(self.title_en or self.title)
+        self.normalized_original_title = normalize_title(self.title)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and {"title", "title_en"} & set(update_fields):
+            kwargs["update_fields"] = {*update_fields, "normalized_title", "normalized_original_title"}
+        super().save(*args, **kwargs)
+
 
 class Source(models.Model):
     movie = models.ForeignKey(Movie, on_delete=models.CASCADE, related_name="sources", db_column="movie_id")
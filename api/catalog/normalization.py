@@ -0,0 +1,40 @@
+import functools
+import re
+import string
+
+COMMON_WORDS = frozenset({"the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for", "of", "with", "by"})
+
+_PUNCT_RE = re.compile(r"[^\w\s]", re.UNICODE)
+
+
+class _PunctuationTable(dict):
+    """
+    str.translate table mapping every code point matched by ``[^\\w\\s]`` to a space.
+
+    Common ASCII/Persian punctuation is seeded up front; any other code point is
+    classified with the regex on first sight and cached, so the table stays exact.
+    """
+
+    def __missing__(self, codepoint):
+        value = " " if _PUNCT_RE.match(chr(codepoint)) else codepoint
+        self[codepoint] = value
+        return value
+
+
+_PUNCT_TRANSLATE = _PunctuationTable(
+    {ord(char): " " for char in string.punctuation + "،؛؟«»٪٬" if _PUNCT_RE.match(char)}  # "_" is a word char
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_title(title: str, common_words: frozenset) -> str:
+    title = title.lower().strip()
+    title = title.translate(_PUNCT_TRANSLATE)
+    return " ".join([word for word in title.split() if word not in common_words])
+
+
+def normalize_title(title: str, common_words: frozenset = COMMON_WORDS) -> str:
+    """Lowercase, strip punctuation and drop stopwords so titles compare on content only"""
+    if not title:
+        return ""
+    return _normalize_title(title, common_words)
@@ -1,23 +1,60 @@
-import json
+import functools
+import logging
+from hashlib import blake2b
 
+import orjson
 import redis
 from django.conf import settings
 
+from .normalization import normalize_title
+
+logger = logging.getLogger(__name__)
+
+
+def match_cache_key(title, title_en, year, movie_type):
+    """
+    Fixed-size key for the match cache, built from the same identity as exact matching:
+    the normalized ``title_en or title``, the normalized original title, the year and the type,
+    or the raw titles and year when nothing is left after normalizing
+    """
+    normalized, normalized_original = normalize_title(title_en or title), normalize_title(title)
+    if normalized or normalized_original:
+        identity = f"{normalized}|{normalized_original}|{year}|{movie_type}"
+    else:
+        identity = f"raw|{title}|{title_en or ''}|{year}"
+    digest = blake2b(identity.encode(), digest_size=8).digest()
+    return b"m:" + digest
+
+
+def match_cache_value(movie):
+    """Compact match-cache payload; enough to link a source without reading the movie back"""
+    return orjson.dumps({"id": movie.id, "title": movie.title, "year": movie.year})
+
+
+@functools.lru_cache(maxsize=None)
+def _connection_pool():
+    """
+    One pool per process, shared by every RedisClient. Bounded and blocking: under bursts, threads
+    wait for a free connection instead of failing. redis-py picks the hiredis parser when installed.
+    """
+    return redis.BlockingConnectionPool(
+        host=settings.REDIS_HOST, port=settings.REDIS_PORT, db=settings.REDIS_DB, decode_responses=True,
+        max_connections=32, timeout=2
+    )
+
 
 class RedisClient:
     def __init__(self):
-        self.redis = redis.Redis(
-            host=settings.REDIS_HOST, port=settings.REDIS_PORT, db=settings.REDIS_DB, decode_responses=True
-        )
+        self.redis = redis.Redis(connection_pool=_connection_pool())
 
     def cache_item(self, item_id, data, expire=3600):
         key = f"item:{item_id}"
-        self.redis.setex(key, expire, json.dumps(data))
+        self.redis.setex(key, expire, orjson.dumps(data))
 
     def get_cached_item(self, item_id):
         key = f"item:{item_id}"
         data = self.redis.get(key)
-        return json.loads(data) if data else None
+        return orjson.loads(data) if data else None
 
     def increment_view_count(self, item_id):
         key = f"views:{item_id}"
@@ -25,10 +62,35 @@ class RedisClient:
 
     def cache_api_response(self, endpoint, params, data, expire=300):
         """Cache API responses for better performance"""
-        key = f"api:{endpoint}:{json.dumps(params, sort_keys=True)}"
-        self.redis.setex(key, expire, json.dumps(data))
+        key = f"api:{endpoint}:{orjson.dumps(params, option=orjson.OPT_SORT_KEYS).decode()}"
+        self.redis.setex(key, expire, orjson.dumps(data))
 
     def get_cached_api_response(self, endpoint, params):
-        key = f"api:{endpoint}:{json.dumps(params, sort_keys=True)}"
+        key = f"api:{endpoint}:{orjson.dumps(params, option=orjson.OPT_SORT_KEYS).decode()}"
         data = self.redis.get(key)
-        return json.loads(data) if data else None
+        return orjson.loads(data) if data else None
+
+    def get_cached_matches(self, lookups):
+        """
+        Look up cached match payloads for many (title, title_en, year, movie_type) tuples in one MGET;
+        all misses if Redis fails
+        """
+        if not lookups:
+            return []
+        try:
+            return self.redis.mget([match_cache_key(*lookup) for lookup in lookups])
+        except redis.exceptions.RedisError as e:
+            logger.warning(f"Match cache read failed: {e}")
+            return [None] * len(lookups)
+
+    def cache_matches(self, matches, expire=7200):
+        """Write many ((title, title_en, year, movie_type), movie) match entries in one pipelined round trip"""
+        if not matches:
+            return
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            for lookup, movie in matches:
+                pipe.setex(match_cache_key(*lookup), expire, match_cache_value(movie))
+            pipe.execute()
+        except redis.exceptions.RedisError as e:
+            logger.warning(f"Match cache write failed: {e}")
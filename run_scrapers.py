@@ -86,9 +86,6 @@ def main():
     settings.setdict(
         {
             "LOG_LEVEL": "INFO",
-            "DOWNLOAD_DELAY": 0.5,
-            "AUTOTHROTTLE_ENABLED": True,
-            "CONCURRENT_REQUESTS": 2,
             "TWISTED_REACTOR": "twisted.internet.asyncioreactor.AsyncioSelectorReactor",
             # Pipeline settings
             "ITEM_PIPELINES": {
@@ -96,15 +93,6 @@ def main():
             },
             # Redis settings for Docker
             "REDIS_URL": "redis://redis:6379/0",
-            # Playwright settings
-            "DOWNLOAD_HANDLERS": {
-                "http": "scrapy_playwright.handler.ScrapyPlaywrightDownloadHandler",
-                "https": "scrapy_playwright.handler.ScrapyPlaywrightDownloadHandler",
-            },
-            "PLAYWRIGHT_LAUNCH_OPTIONS": {
-                "headless": True,
-                "args": ["--no-sandbox", "--disable-dev-shm-usage", "--disable-gpu"],
-            },
         },
         priority="cmdline",
     )
@@ -1,23 +1,49 @@
 import logging
 import os
 import sys
+import threading
+from typing import ClassVar
 
 import django
-from api.catalog.matching_engine import ContentManager  # NEW: Import ContentManager
-from api.catalog.models import Genre, Movie, Platform, Source
+import orjson
 from django.conf import settings
-from django.db import transaction
 from itemadapter import ItemAdapter
-from redis import ConnectionPool, Redis, exceptions as redis_exceptions
 from twisted.internet.threads import deferToThread
 
+
+def _setup_django():
+	"""Configure Django once, at import, so the models below can be bound as module globals"""
+	api_path = os.path.join(os.path.dirname(__file__), "..", "api")
+	sys.path.insert(0, api_path)
+
+	os.environ.setdefault("DJANGO_SETTINGS_MODULE", "vod.settings")
+
+	if not settings.configured:
+		django.setup()
+
+
+_setup_django()
+
+from api.catalog.matching_engine import ContentManager  # noqa: E402
+from api.catalog.models import Genre, Platform  # noqa: E402
+from django.db import transaction  # noqa: E402
+
 logger = logging.getLogger(__name__)
 
+# Number of scraped items written per transaction (and per bulk INSERT of their sources)
+BATCH_SIZE = 500
+# Number of match-cache entries buffered before they are sent in one Redis pipeline
+CACHE_BATCH_SIZE = 100
+
 
 class PostgreSQLPipeline:
-	def __init__(self, redis_client):
-		self.redis = redis_client
-		self.django_setup_done = False
+	# Built once: Platform is importable at class creation since Django is set up at module import
+	_SPIDER_TO_PLATFORM: ClassVar[dict[str, str]] = {
+		"filimo": Platform.FILIMO,
+		"namava": Platform.NAMAVA,
+	}
+
+	def __init__(self):
 		self.content_manager = None
 		self.stats = {
 			"items_created": 0,
@@ -28,66 +54,19 @@ class PostgreSQLPipeline:
 			"sources_updated": 0
 		}
 		self.genre_cache = {}
-
-	@classmethod
-	def from_crawler(cls, crawler):
-		"""
-		Prefer REDIS_URL if present, otherwise use REDIS_HOST/PORT/DB.
-		Uses a ConnectionPool to avoid creating too many connections.
-		"""
-		redis_url = crawler.settings.get("REDIS_URL") or os.environ.get("REDIS_URL")
-		try:
-			if redis_url:
-				pool = ConnectionPool.from_url(redis_url, decode_responses=True)
-			else:
-				host = crawler.settings.get("REDIS_HOST", "redis")
-				port = int(crawler.settings.get("REDIS_PORT", 6379))
-				db = int(crawler.settings.get("REDIS_DB", 0))
-				pool = ConnectionPool(host=host, port=port, db=db, decode_responses=True)
-			redis_client = Redis(connection_pool=pool)
-			# quick ping to validate connection (will raise if can't connect)
-			try:
-				redis_client.ping()
-			except redis_exceptions.RedisError as e:
-				logger.warning(f"Redis ping failed in pipeline init: {e}")
-			return cls(redis_client)
-		except Exception as e:
-			logger.error(f"Failed to create redis client: {e}")
-			fallback = Redis(host="localhost", port=6379, db=0, decode_responses=True)
-			return cls(fallback)
-
-	def _setup_django(self):
-		if self.django_setup_done:
-			return
-
-		api_path = os.path.join(os.path.dirname(__file__), "..", "api")
-		sys.path.insert(0, api_path)
-
-		os.environ.setdefault("DJANGO_SETTINGS_MODULE", "vod.settings")
-
-		if not settings.configured:
-			django.setup()
-
-		self.django_setup_done = True
+		self._pending = []
+		self._cache_buffer = []
+		self._cache_lock = threading.Lock()
 
 	def open_spider(self, spider):
 		"""Run setup in a thread to avoid async issues"""
-		# Setup Django synchronously first
-		self._setup_django()
-
-		# Then load genres in a thread
+		# Load genres in a thread
 		return deferToThread(self._open_spider_sync, spider)
 
 	def _open_spider_sync(self, spider):
 		"""Synchronous spider opening"""
 
-		self.Movie = Movie
-		self.Source = Source
-		self.Genre = Genre
-		self.Platform = Platform
-		self.transaction = transaction
-
-		self.content_manager = ContentManager()
+		self.content_manager = ContentManager(preload_catalog=True)
 
 		logger.info("PostgreSQL pipeline with enhanced content matching opened")
 		self.stats = {
@@ -100,96 +79,169 @@ class PostgreSQLPipeline:
 		}
 
 		# Load genre cache
-		for genre in self.Genre.objects.all():
+		for genre in Genre.objects.all():
 			self.genre_cache[genre.name] = genre
 		logger.info(f"Loaded {len(self.genre_cache)} genres into cache")
 
 	def close_spider(self, spider):
+		return deferToThread(self._close_spider_sync, spider)
+
+	def _close_spider_sync(self, spider):
+		pending, self._pending = self._pending, []
+		self._process_batch_sync(pending, spider)
+		self._flush_redis_cache()
 		logger.info(f"Pipeline stats: {self.stats}")
 
 	def process_item(self, item, spider):
-		"""Use deferToThread to process items in threads"""
-		return deferToThread(self._process_item_sync, item, spider)
+		"""Queue items and write them in batches of BATCH_SIZE, in a worker thread"""
+		self._pending.append(item)
+		if len(self._pending) < BATCH_SIZE:
+			return item
+		batch, self._pending = self._pending, []
+		return deferToThread(self._process_batch_sync, batch, spider).addCallback(lambda _: item)
+
+	def _process_batch_sync(self, batch, spider):
+		"""Write a batch in one transaction so the commit (and WAL flush) is paid once per batch"""
+		if not batch:
+			return
+		records = [record for record in (self._item_to_record(item, spider) for item in batch) if record]
+		if not records:
+			return
 
-	def _process_item_sync(self, item, spider):
-		"""Synchronous item processing - COMPLETELY REWRITTEN"""
-		if not self.django_setup_done:
-			self._setup_django()
+		# Genre names -> Genre objects for the whole batch at once
+		self._resolve_genres({name for record in records for name in record["genres"]})
+		for record in records:
+			record["genres"] = [self.genre_cache[name] for name in record["genres"] if name in self.genre_cache]
 
 		try:
-			adapter = ItemAdapter(item)
+			with transaction.atomic():
+				results = self.content_manager.process_scraped_batch(records)
+				self._flush_sources([source for _, _, source in results])
+		except Exception as e:
+			# e.g. a unique-constraint clash on insert: redo the batch row by row with savepoints
+			logger.warning(f"Bulk write of {len(records)} items failed ({e}); retrying item by item")
+			with transaction.atomic():
+				results = [self._process_record_sync(record) for record in records]
+				self._flush_sources([result[2] for result in results if result])
+
+		# The batch is committed at this point, so cached ids always refer to real rows
+		for record, result in zip(records, results, strict=True):
+			if result:
+				self._record_result(record, result[0], result[1])
+
+	def _item_to_record(self, item, spider):
+		"""Extract and validate the fields process_scraped_content needs from a scraped item"""
+		try:
+			# Spiders yield plain dicts; only wrap other item types
+			adapter = item if isinstance(item, dict) else ItemAdapter(item)
 
-			# Extract and validate required fields
-			title = adapter.get("title", "").strip()
-			title_en = adapter.get("title_en", "").strip()
+			title = (adapter.get("title") or "").strip()
+			title_en = (adapter.get("title_en") or "").strip()
 			year = adapter.get("release_year") or adapter.get("year")
 
 			if not title or not year:
-				logger.warning(f"Skipping item missing title or year: {adapter}")
-				return item
-
-			# Prepare genres list
-			genre_objects = self._prepare_genres(adapter.get("genres", []))
-
-			movie, content_created, source_created = self.content_manager.process_scraped_content(
-				title=title,
-				title_en=title_en,
-				release_year=year,
-				movie_type=adapter.get("type", "movie"),
-				platform=self._get_platform_from_spider(spider.name),
-				source_id=adapter.get("source_id"),
-				url=adapter.get("url", ""),
-				raw_payload=adapter.get("raw_data"),
-				genres=genre_objects)
-
-			# Update statistics based on what happened
-			if content_created:
-				self.stats["items_created"] += 1
-				logger.info(f"✅ NEW content created: {movie.title}")
-			else:
-				self.stats["matches_found"] += 1
-				logger.info(f"🔗 EXISTING content matched: {movie.title}")
+				logger.warning("Skipping item missing title or year: %s", adapter)
+				return None
+
+			# Spiders hand raw_data over as orjson bytes, which are far smaller than the nested dict
+			# while items wait in the batch queue; decode it only now, just before the JSONField insert
+			raw_payload = adapter.get("raw_data")
+			if isinstance(raw_payload, (bytes, bytearray)):
+				raw_payload = orjson.loads(raw_payload)
+
+			return {
+				"title": title,
+				"title_en": title_en,
+				"release_year": year,
+				"movie_type": adapter.get("type", "movie"),
+				"platform": self._get_platform_from_spider(spider.name),
+				"source_id": adapter.get("source_id"),
+				"url": adapter.get("url", ""),
+				"raw_payload": raw_payload,
+				"genres": self._prepare_genres(adapter.get("genres", [])),
+			}
+		except Exception as e:
+			logger.exception(f"Error processing item: {e}")
+			self.stats["errors"] += 1
+			return None
 
-			if source_created:
-				self.stats["sources_added"] += 1
-				logger.info(f"📺 NEW source linked: {spider.name}")
+	def _process_record_sync(self, record):
+		"""Fallback path: process one record inside a savepoint; returns (movie, created, source) or None"""
+		try:
+			# Savepoint, so a failing item rolls back alone instead of aborting the batch
+			with transaction.atomic():
+				return self.content_manager.process_scraped_content(**record, defer_source=True)
+		except Exception as e:
+			logger.exception(f"Error processing item: {e}")
+			self.stats["errors"] += 1
+			return None
+
+	def _record_result(self, record, movie, content_created):
+		# Update statistics based on what happened
+		if content_created:
+			self.stats["items_created"] += 1
+		else:
+			self.stats["matches_found"] += 1
+		if logger.isEnabledFor(logging.INFO):
+			if content_created:
+				logger.info("✅ NEW content created: %s", movie.title)
 			else:
-				self.stats["sources_updated"] += 1
-				logger.info(f"🔄 Source updated: {spider.name}")
+				logger.info("🔗 EXISTING content matched: %s", movie.title)
 
-			self._update_redis_cache(movie, title, year)
-
-			return item
+		# Matches are cached by the matcher itself; only newly created ids are new to Redis
+		if content_created:
+			self._update_redis_cache(movie, record)
 
+	def _flush_sources(self, batch):
+		if not batch:
+			return
+		try:
+			with transaction.atomic():
+				created = self.content_manager.create_sources_bulk(batch, batch_size=BATCH_SIZE)
 		except Exception as e:
-			logger.exception(f"Error processing item: {e}")
-			self.stats["errors"] += 1
-			return item
+			logger.exception(f"Error flushing {len(batch)} sources: {e}")
+			self.stats["errors"] += len(batch)
+			return
+		self.stats["sources_added"] += created
+		self.stats["sources_updated"] += len(batch) - created
+		logger.info("📺 Linked %d new sources (%d already known)", created, len(batch) - created)
 
 	def _prepare_genres(self, genre_names):
-		"""Convert genre names to Genre objects"""
-		genre_objects = []
-		for genre_name in genre_names:
-			if genre_name and genre_name.strip():
-				cleaned_genre = genre_name.strip()
-				if cleaned_genre not in self.genre_cache:
-					genre, created = self.Genre.objects.get_or_create(name=cleaned_genre)
-					self.genre_cache[cleaned_genre] = genre
-				genre_objects.append(self.genre_cache[cleaned_genre])
-		return genre_objects
-
-	def _update_redis_cache(self, movie, title, year):
-		"""Update Redis cache for future matching"""
-		cache_key = f"match:{title}:{year}"
+		"""Clean genre names; they are resolved to Genre objects per batch by _resolve_genres"""
+		return [genre_name.strip() for genre_name in genre_names if genre_name and genre_name.strip()]
+
+	def _resolve_genres(self, genre_names):
+		"""Load or create every genre missing from the cache with a fixed number of queries"""
+		missing = set(genre_names) - self.genre_cache.keys()
+		if not missing:
+			return
 		try:
-			self.redis.setex(cache_key, 7200, str(movie.id))  # 2 hours cache
-		except redis_exceptions.ConnectionError as e:
-			logger.warning(f"Redis cache update failed: {e}")
+			found = Genre.objects.in_bulk(missing, field_name="name")
+			to_create = missing - found.keys()
+			if to_create:
+				Genre.objects.bulk_create([Genre(name=name) for name in to_create], ignore_conflicts=True)
+				found.update(Genre.objects.in_bulk(to_create, field_name="name"))
+		except Exception as e:
+			logger.exception(f"Error resolving genres {sorted(missing)}: {e}")
+			return
+		self.genre_cache.update(found)
+
+	def _update_redis_cache(self, movie, record):
+		"""Queue a match-cache entry; entries are written CACHE_BATCH_SIZE at a time"""
+		lookup = (record["title"], record["title_en"], record["release_year"], record["movie_type"])
+		with self._cache_lock:
+			self._cache_buffer.append((lookup, movie))
+			if len(self._cache_buffer) < CACHE_BATCH_SIZE:
+				return
+		self._flush_redis_cache()
+
+	def _flush_redis_cache(self):
+		"""Send buffered match-cache entries in one round trip, through the matcher's Redis client"""
+		with self._cache_lock:
+			entries, self._cache_buffer = self._cache_buffer, []
+		# cache_matches logs and skips Redis failures itself
+		self.content_manager.matcher.redis.cache_matches(entries)
 
 	def _get_platform_from_spider(self, spider_name):
 		"""Map spider name to platform"""
-		spider_to_platform = {
-			"filimo": self.Platform.FILIMO,
-			"namava": self.Platform.NAMAVA,
-		}
-		return spider_to_platform.get(spider_name, self.Platform.FILIMO)
+		return self._SPIDER_TO_PLATFORM.get(spider_name, Platform.FILIMO)
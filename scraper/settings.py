@@ -24,19 +24,38 @@ except ValueError:
 
 # --- Scrapy throttle / concurrency from env ---
 try:
-    DOWNLOAD_DELAY = float(os.environ.get("SCRAPER_DOWNLOAD_DELAY", "1.0"))
+    DOWNLOAD_DELAY = float(os.environ.get("SCRAPER_DOWNLOAD_DELAY", "0"))
 except ValueError:
-    DOWNLOAD_DELAY = 1.0
+    DOWNLOAD_DELAY = 0.0
 
 try:
-    CONCURRENT_REQUESTS = int(os.environ.get("SCRAPER_CONCURRENT_REQUESTS", "1"))
+    CONCURRENT_REQUESTS = int(os.environ.get("SCRAPER_CONCURRENT_REQUESTS", "16"))
 except ValueError:
-    CONCURRENT_REQUESTS = 1
+    CONCURRENT_REQUESTS = 16
 
 try:
-    CONCURRENT_REQUESTS_PER_DOMAIN = int(os.environ.get("SCRAPER_CONCURRENT_REQUESTS_PER_DOMAIN", "1"))
+    CONCURRENT_REQUESTS_PER_DOMAIN = int(os.environ.get("SCRAPER_CONCURRENT_REQUESTS_PER_DOMAIN", "8"))
 except ValueError:
-    CONCURRENT_REQUESTS_PER_DOMAIN = 1
+    CONCURRENT_REQUESTS_PER_DOMAIN = 8
+
+# AutoThrottle backs off on server pushback; the target lets it keep several requests in flight
+AUTOTHROTTLE_ENABLED = True
+AUTOTHROTTLE_START_DELAY = 0.5
+AUTOTHROTTLE_MAX_DELAY = 10
+try:
+    AUTOTHROTTLE_TARGET_CONCURRENCY = float(os.environ.get("SCRAPER_AUTOTHROTTLE_TARGET_CONCURRENCY", "8.0"))
+except ValueError:
+    AUTOTHROTTLE_TARGET_CONCURRENCY = 8.0
+
+# The catalog APIs are JSON over HTTPS: HTTP/2 multiplexes concurrent requests on one connection
+DOWNLOAD_HANDLERS = {
+    "https": "scrapy.core.downloader.handlers.http2.H2DownloadHandler",
+}
+TWISTED_REACTOR = "twisted.internet.asyncioreactor.AsyncioSelectorReactor"
+# Pipelines hand work to the reactor thread pool once per batch, not per item, so a small pool
+# is enough and bounds the DB connections held by worker threads
+REACTOR_THREADPOOL_MAXSIZE = 4
+ROBOTSTXT_OBEY = False
 
 # --- Retry + headers ---
 RETRY_ENABLED = str(os.environ.get("SCRAPER_RETRY_ENABLED", "true")).lower() in ("1", "true", "yes")
@@ -44,11 +63,15 @@ try:
     RETRY_TIMES = int(os.environ.get("SCRAPER_RETRY_TIMES", "2"))
 except ValueError:
     RETRY_TIMES = 2
+RETRY_HTTP_CODES = [500, 502, 503, 504, 408]
 
 DEFAULT_REQUEST_HEADERS = {
     "Accept": "application/json, text/plain, */*",
     "Accept-Language": "en-US,en;q=0.9,fa;q=0.8",
-    "User-Agent": os.environ.get("SCRAPER_USER_AGENT", "vod-scraper/1.0"),
+    "User-Agent": os.environ.get(
+        "SCRAPER_USER_AGENT",
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    ),
 }
 
 # Logging
@@ -77,32 +100,3 @@ else:
     REDIS_HOST = os.environ.get("REDIS_HOST", "redis")
     REDIS_PORT = int(os.environ.get("REDIS_PORT", "6379"))
     REDIS_DB = int(os.environ.get("REDIS_DB", "0"))
-
-
-# Scrapy settings
-ROBOTSTXT_OBEY = False
-DOWNLOAD_DELAY = float(os.environ.get("SCRAPER_DOWNLOAD_DELAY", "1.0"))
-CONCURRENT_REQUESTS = int(os.environ.get("SCRAPER_CONCURRENT_REQUESTS", "1"))
-CONCURRENT_REQUESTS_PER_DOMAIN = int(os.environ.get("SCRAPER_CONCURRENT_REQUESTS_PER_DOMAIN", "1"))
-
-# AutoThrottle
-AUTOTHROTTLE_ENABLED = True
-AUTOTHROTTLE_START_DELAY = 2
-AUTOTHROTTLE_MAX_DELAY = 10
-AUTOTHROTTLE_TARGET_CONCURRENCY = 0.5
-
-# Retry settings
-RETRY_ENABLED = True
-RETRY_TIMES = 2
-RETRY_HTTP_CODES = [500, 502, 503, 504, 408]
-
-# Headers
-DEFAULT_REQUEST_HEADERS = {
-    "Accept": "application/json, text/plain, */*",
-    "Accept-Language": "en-US,en;q=0.9,fa;q=0.8",
-    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-}
-
-# Logging
-LOG_LEVEL = "INFO"
-LOG_FORMAT = "%(asctime)s [%(name)s] %(levelname)s: %(message)s"
@@ -1,10 +1,15 @@
 import logging
 from typing import ClassVar
 
+import orjson
 import scrapy
 
 logger = logging.getLogger(__name__)
 
+_PERSIAN_TRANS = str.maketrans("۰۱۲۳۴۵۶۷۸۹", "0123456789")
+# The only attributes kept in Source.raw_payload; the rest of the API object is never read
+_RAW_ATTRIBUTES = ("movie_title", "movie_title_en", "pro_year", "categories", "movie_id", "uid")
+
 
 class FilimoSpider(scrapy.Spider):
     name = "filimo"
@@ -29,7 +34,7 @@ class FilimoSpider(scrapy.Spider):
     start_urls = ["https://api.filimo.com/api/fa/v1/movie/movie/list/tagid/1/other_data/movie-new_nocomingsoon"]
 
     def parse(self, response, **kwargs):
-        data = response.json()
+        data = orjson.loads(response.body)
         included = data.get("included", [])
         movies = [item for item in included if item.get("type") == "movies"]
 
@@ -54,18 +59,15 @@ class FilimoSpider(scrapy.Spider):
                 "genres": genres,
                 "source_id": source_id,
                 "url": f"https://www.filimo.com/m/{source_id}",
-                "raw_data": movie,
+                "raw_data": orjson.dumps(
+                    {"id": source_id, "attributes": {key: attr.get(key) for key in _RAW_ATTRIBUTES}}
+                ),
             }
 
     def _safe_int(self, value):
-        if not value:
+        if value is None:
             return None
         try:
-            value_str = str(value)
-            persian_digits = "۰۱۲۳۴۵۶۷۸۹"
-            if any(ch in persian_digits for ch in value_str):
-                trans_table = str.maketrans("۰۱۲۳۴۵۶۷۸۹", "0123456789")
-                value_str = value_str.translate(trans_table)
-            return int(value_str)
-        except Exception:
+            return int(str(value).translate(_PERSIAN_TRANS).strip())
+        except (ValueError, TypeError):
             return None
@@ -1,10 +1,13 @@
 import logging
 from typing import ClassVar
 
+import orjson
 import scrapy
 
 logger = logging.getLogger(__name__)
 
+_RAW_FIELDS = ("id", "caption", "year", "categories")
+
 
 class NamavaSpider(scrapy.Spider):
     name = "namava"
@@ -13,19 +16,21 @@ class NamavaSpider(scrapy.Spider):
     # You can set this limit before running the spider
     max_pages = 2
 
-    page_index = 1
     page_size = 20
 
     def start_requests(self):
-        url = self._latest_movies_url(self.page_index, self.page_size)
-        yield scrapy.Request(url, callback=self.parse)
-
-    def parse(self, response, **kwargs):
-        data = response.json()
+        # The page count is capped by max_pages, so request every page up front and let the
+        # downloader fetch them concurrently instead of chaining page N+1 behind page N
+        for page in range(1, self.max_pages + 1):
+            url = self._latest_movies_url(page, self.page_size)
+            yield scrapy.Request(url, callback=self.parse, cb_kwargs={"page": page})
+
+    def parse(self, response, page=None, **kwargs):
+        data = orjson.loads(response.body)
         movies = data.get("result", [])
 
         if not movies:
-            logger.info(f"No movies found on page {self.page_index}")
+            logger.info(f"No movies found on page {page}")
             return
 
         for movie in movies:
@@ -36,14 +41,8 @@ class NamavaSpider(scrapy.Spider):
                 preview_url, callback=self.parse_movie, meta={"source_id": movie_id, "base_title": caption}
             )
 
-        # Pagination with limit check
-        if len(movies) == self.page_size and self.page_index < self.max_pages:
-            self.page_index += 1
-            next_url = self._latest_movies_url(self.page_index, self.page_size)
-            yield scrapy.Request(next_url, callback=self.parse)
-
     def parse_movie(self, response):
-        data = response.json()
+        data = orjson.loads(response.body)
         result = data.get("result", {})
 
         title = result.get("caption")
@@ -71,7 +70,7 @@ class NamavaSpider(scrapy.Spider):
             "genres": genres,
             "source_id": source_id,
             "url": response.url,
-            "raw_data": result,
+            "raw_data": orjson.dumps({key: result.get(key) for key in _RAW_FIELDS}),
         }
 
     def _latest_movies_url(self, page, size):